@@ -6,6 +6,9 @@ import subprocess
 import time
 import json
 
+# 预期注册的工具集合，模块加载时构建一次
+_EXPECTED_TOOLS = frozenset(("connect", "disconnect", "create", "read", "update", "delete", "bulk"))
+
 def test_server():
     """测试服务器基本功能"""
     
@@ -30,21 +33,19 @@ def test_server():
         print(f"❌ 服务器模块导入失败: {e}")
         return False
     
-    # 测试工具注册
-    tools = mcp.get_tools()
-    expected_tools = {'connect', 'disconnect', 'create', 'read', 'update', 'delete'}
-    actual_tools = {tool.name for tool in tools}
-    
-    if expected_tools.issubset(actual_tools):
+    # 测试工具注册，直接在注册表的 dict_keys 上做成员检查，不再构建临时集合
+    actual_tools = mcp._tool_manager._tools.keys()
+    missing = [name for name in _EXPECTED_TOOLS if name not in actual_tools]
+
+    if not missing:
         print("✅ 所有工具已正确注册")
         print(f"   注册的工具: {', '.join(sorted(actual_tools))}")
     else:
-        missing = expected_tools - actual_tools
         print(f"❌ 缺少工具: {', '.join(missing)}")
         return False
     
     # 测试连接状态
-    if not mongo_server.is_connected():
+    if not mongo_server.is_connected:
         print("✅ 初始连接状态正确（未连接）")
     else:
         print("⚠️  初始连接状态异常（已连接）")